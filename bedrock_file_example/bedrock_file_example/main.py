@@ -4,16 +4,29 @@ CLI tool to interact with Claude Opus 4.5 on Amazon Bedrock.
 Supports multiple file inputs and saves generated files.
 """
 
+import binascii
+import io
 import json
-import base64
-import mimetypes
+import mmap
+import os
+import re
 import sys
+import tempfile
+import time
+import uuid
+import xml.etree.ElementTree as ET
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, BinaryIO, Iterable, Iterator, List, Optional
 
-import boto3
 import click
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # Model ID for Claude Opus 4.5 on Bedrock
 MODEL_ID = "global.anthropic.claude-opus-4-5-20251101-v1:0"
@@ -27,178 +40,559 @@ DOCUMENT_FORMATS = {'.pdf'}
 # Text extraction formats (will be converted to text)
 TEXT_EXTRACTION_FORMATS = {'.csv', '.doc', '.docx', '.xls', '.xlsx', '.html', '.txt', '.md'}
 
+# Media types for the image and document formats
+EXT_TO_MIME = {
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.gif': 'image/gif',
+    '.webp': 'image/webp',
+    '.pdf': 'application/pdf',
+}
+
+# Bedrock limits for a single image or document
+MAX_IMAGE_BYTES = 3_932_160  # 3.75 MB
+MAX_DOCUMENT_BYTES = 4_718_592  # 4.5 MB
+
+# Longest image edge the model makes use of, and quality for resized images
+MAX_IMAGE_DIMENSION = 1568
+RESIZED_JPEG_QUALITY = 85
+
+# Budget for attachment data in a single request body
+MAX_TOTAL_ATTACHMENT_BYTES = 20 * 1024 * 1024
+
+# WordprocessingML tags used for DOCX text extraction
+W_NAMESPACE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+W_PARAGRAPH = W_NAMESPACE + 'p'
+W_RUN = W_NAMESPACE + 'r'
+W_HYPERLINK = W_NAMESPACE + 'hyperlink'
+W_TEXT = W_NAMESPACE + 't'
+W_BREAK = W_NAMESPACE + 'br'
+W_TYPE = W_NAMESPACE + 'type'
+DOCX_SPECIAL_CHARS = {
+    W_NAMESPACE + 'tab': '\t',
+    W_NAMESPACE + 'ptab': '\t',
+    W_NAMESPACE + 'cr': '\n',
+    W_NAMESPACE + 'noBreakHyphen': '-',
+}
+
+# Read size for base64 streaming (multiple of 3 so no padding mid-stream)
+BASE64_CHUNK_SIZE = 57 * 1024
+
+# Buffer size for reading attachments from disk
+READ_BUFFER_SIZE = 1024 * 1024
+
+# Buffer size for writing output files
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Responses longer than this many characters are saved to output.txt
+LONG_OUTPUT_LENGTH = 5000
+
+# Seconds between status checks of a batch inference job
+BATCH_POLL_INTERVAL = 30
+
+# Batch inference job states that have not finished yet
+BATCH_PENDING_STATES = {'Submitted', 'Validating', 'Scheduled', 'InProgress', 'Stopping'}
 
-def encode_file(file_path: Path) -> tuple[str, str]:
+# botocore Config settings for clients; the pool is sized for
+# --max-parallel-requests, and the read timeout allows for long generations
+CLIENT_CONFIG = {
+    'max_pool_connections': 64,
+    'retries': {'mode': 'adaptive', 'max_attempts': 6},
+    'tcp_keepalive': True,
+    'connect_timeout': 10,
+    'read_timeout': 600,
+}
+
+# AWS clients keyed by (service name, profile, region)
+_CLIENT_CACHE: dict[tuple, Any] = {}
+
+# Stands in for FileRef values while the rest of a request body is serialized
+FILE_REF_MARKER = f"\x00file-ref-{uuid.uuid4().hex}\x00"
+
+# Fenced code blocks in UTF-8 model output. The fence tag also accepts
+# non-ASCII bytes, which are checked against CODE_TAG_RE once decoded
+CODE_BLOCK_RE = re.compile(rb'```((?:[\w]|[\x80-\xff])*)\n(.*?)```', re.DOTALL)
+CODE_TAG_RE = re.compile(r'\w*')
+
+
+def write_base64(file_path: Path, out: BinaryIO) -> None:
     """
-    Encode a file to base64 and determine its media type.
+    Stream a file as base64 into a binary output sink.
     
-    Returns:
-        tuple: (base64_data, media_type)
-    """
-    with open(file_path, 'rb') as f:
-        file_data = f.read()
-    
-    base64_data = base64.standard_b64encode(file_data).decode('utf-8')
-    
-    # Determine media type
-    mime_type, _ = mimetypes.guess_type(str(file_path))
-    if mime_type is None:
-        # Default to appropriate type based on extension
-        ext = file_path.suffix.lower()
-        if ext in IMAGE_FORMATS:
-            mime_type = f"image/{ext[1:]}" if ext != '.jpg' else "image/jpeg"
-        elif ext == '.pdf':
-            mime_type = "application/pdf"
-        else:
-            mime_type = "text/plain"
+    Only one chunk of the file is held in memory at a time.
     
-    return base64_data, mime_type
+    Args:
+        file_path: File to encode
+        out: Binary stream receiving the base64 bytes
+    """
+    with open(file_path, 'rb', buffering=READ_BUFFER_SIZE) as f:
+        while chunk := f.read(BASE64_CHUNK_SIZE):
+            out.write(binascii.b2a_base64(chunk, newline=False))
+
+
+def get_media_type(file_path: Path) -> str:
+    """Determine the media type of a file from its extension."""
+    return EXT_TO_MIME.get(file_path.suffix.lower(), 'application/octet-stream')
+
+
+class FileRef:
+    """
+    Placeholder for file data in a content block.
+    
+    The file is only read and base64-encoded when the request body is
+    written, so the encoded data never exists as a Python string.
+    
+    The Converse API's raw-bytes sources are not used instead: botocore
+    base64-encodes them into an in-memory JSON body itself, so the same
+    bytes go over the wire with several full copies held in memory.
+    """
+    
+    def __init__(self, file_path: Path):
+        self.file_path = file_path
+    
+    def write_json(self, out: BinaryIO) -> None:
+        """Write the file contents to out as a quoted base64 JSON string."""
+        out.write(b'"')
+        write_base64(self.file_path, out)
+        out.write(b'"')
+
+
+class TextFileRef(FileRef):
+    """
+    Placeholder for the contents of a UTF-8 text file in a content block.
+    
+    The header and file text are JSON-escaped and streamed into the request
+    body, so the file is never held in memory as a single string.
+    """
+    
+    def __init__(self, file_path: Path, header: str):
+        super().__init__(file_path)
+        self.header = header
+    
+    def write_json(self, out: BinaryIO) -> None:
+        """Write the header and file text to out as a quoted JSON string."""
+        out.write(b'"')
+        # Escaping is per character, so chunks can be escaped independently
+        out.write(dumps_json(self.header)[1:-1])
+        with open(self.file_path, 'r', encoding='utf-8', buffering=READ_BUFFER_SIZE) as f:
+            while chunk := f.read(READ_BUFFER_SIZE):
+                out.write(dumps_json(chunk)[1:-1])
+        out.write(b'"')
+
+
+def dumps_json(obj: Any, default=None) -> bytes:
+    """Serialize obj to JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=default)
+    return json.dumps(obj, default=default).encode('utf-8')
+
+
+def loads_json(data) -> Any:
+    """Parse JSON from bytes or str, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def copy_span(out: BinaryIO, start: int, end: int) -> None:
+    """Append the bytes at out[start:end] to the end of out, a chunk at a time."""
+    while start < end:
+        out.seek(start)
+        chunk = out.read(min(READ_BUFFER_SIZE, end - start))
+        start += len(chunk)
+        out.seek(0, io.SEEK_END)
+        out.write(chunk)
+
+
+def write_request_body(
+    request_body: dict,
+    out: BinaryIO,
+    written_spans: Optional[dict] = None
+) -> None:
+    """
+    Serialize a request body as JSON into a binary output sink.
+    
+    Everything except file data is serialized in one call with a marker
+    standing in for each FileRef; each file is then streamed into the
+    output where its marker was. When out is seekable, a FileRef that
+    appears more than once is only read and encoded once: later
+    occurrences copy the bytes already written.
+    
+    Args:
+        request_body: Request body, possibly containing FileRef values
+        out: Binary stream receiving the JSON bytes
+        written_spans: (start, end) offsets in out of FileRefs already
+            written, keyed by id; pass the same dict to share them across
+            calls writing to the same out (optional)
+    """
+    if written_spans is None:
+        written_spans = {}
+    seekable = out.seekable()
+    file_refs = []
+    
+    def default(o):
+        if isinstance(o, FileRef):
+            file_refs.append(o)
+            return FILE_REF_MARKER
+        raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+    
+    parts = dumps_json(request_body, default=default).split(dumps_json(FILE_REF_MARKER))
+    out.write(parts[0])
+    for file_ref, part in zip(file_refs, parts[1:]):
+        span = written_spans.get(id(file_ref))
+        if span is not None:
+            copy_span(out, *span)
+        elif seekable:
+            start = out.tell()
+            file_ref.write_json(out)
+            written_spans[id(file_ref)] = (start, out.tell())
+        else:
+            file_ref.write_json(out)
+        out.write(part)
 
 
 def extract_text_from_docx(file_path: Path) -> str:
-    """Extract text content from a DOCX file."""
+    """
+    Extract text content from a DOCX file.
+    
+    Top-level body paragraphs are streamed from word/document.xml and
+    discarded once read, so the document tree is never built in full.
+    """
+    text_parts = []
+    depth = 0
+    with zipfile.ZipFile(file_path) as docx, docx.open('word/document.xml') as f:
+        for event, element in ET.iterparse(f, events=('start', 'end')):
+            if event == 'start':
+                depth += 1
+                continue
+            
+            # Children of <w:body> sit at depth 3 under <w:document>
+            if depth == 3:
+                if element.tag == W_PARAGRAPH:
+                    text = docx_paragraph_text(element)
+                    if text.strip():
+                        text_parts.append(text)
+                element.clear()
+            depth -= 1
+    return '\n'.join(text_parts)
+
+
+def docx_paragraph_text(paragraph: ET.Element) -> str:
+    """Text of a <w:p> element, from its runs and hyperlink runs."""
+    runs = []
+    for child in paragraph:
+        if child.tag == W_RUN:
+            runs.append(child)
+        elif child.tag == W_HYPERLINK:
+            runs.extend(child.findall(W_RUN))
+    
+    text_parts = []
+    for run in runs:
+        for node in run:
+            if node.tag == W_TEXT:
+                text_parts.append(node.text or '')
+            elif node.tag == W_BREAK:
+                # Page and column breaks carry no text
+                if node.get(W_TYPE, 'textWrapping') == 'textWrapping':
+                    text_parts.append('\n')
+            else:
+                text_parts.append(DOCX_SPECIAL_CHARS.get(node.tag, ''))
+    return ''.join(text_parts)
+
+
+def check_utf8(file_path: Path) -> None:
+    """Raise UnicodeDecodeError if a file is not valid UTF-8, reading it in chunks."""
+    with open(file_path, 'r', encoding='utf-8', buffering=READ_BUFFER_SIZE) as f:
+        while f.read(READ_BUFFER_SIZE):
+            pass
+
+
+def resize_image(file_path: Path) -> Optional[bytes]:
+    """
+    Downscale an image to the model's useful resolution as a JPEG.
+    
+    Returns:
+        JPEG bytes, or None if the image is already small enough to send
+        unchanged
+    """
     try:
-        from docx import Document
-        doc = Document(file_path)
-        text_parts = []
-        for paragraph in doc.paragraphs:
-            if paragraph.text.strip():
-                text_parts.append(paragraph.text)
-        return '\n'.join(text_parts)
+        from PIL import Image, ImageOps
     except ImportError:
-        raise ImportError("python-docx is required to process .docx files. Install with: pip install python-docx")
+        raise ImportError("Pillow is required to resize images. Install with: pip install pillow")
+    
+    with Image.open(file_path) as image:
+        if (max(image.size) <= MAX_IMAGE_DIMENSION
+                and file_path.stat().st_size <= MAX_IMAGE_BYTES):
+            return None
+        # The EXIF orientation is dropped on re-encoding, so apply it first
+        image = ImageOps.exif_transpose(image)
+        image.thumbnail((MAX_IMAGE_DIMENSION, MAX_IMAGE_DIMENSION), Image.LANCZOS)
+        buffer = io.BytesIO()
+        image.convert('RGB').save(buffer, 'JPEG', quality=RESIZED_JPEG_QUALITY, optimize=True)
+    return buffer.getvalue()
 
 
-def process_files(file_paths: List[str]) -> List[dict]:
+def check_file_size(
+    file_path: Path,
+    payload_bytes: int,
+    resize_images: bool = False
+) -> tuple[int, Optional[str]]:
     """
-    Process input files and create content blocks for the API.
+    Check a file against the per-file limits and the request budget.
+    
+    Uses only the file size, so oversized files are rejected before any
+    reading or encoding. Images that will be resized are budgeted at no
+    more than the per-image limit.
     
     Args:
-        file_paths: List of file paths to process
+        file_path: File to check
+        payload_bytes: Attachment bytes already accepted for the request
+        resize_images: Whether images are resized before sending
         
     Returns:
-        List of content blocks for the API request
+        tuple: (bytes the file adds to the request body, warning message
+        or None if the file fits)
     """
-    content_blocks = []
+    ext = file_path.suffix.lower()
+    size = file_path.stat().st_size
     
-    for file_path_str in file_paths:
-        file_path = Path(file_path_str)
-        
-        if not file_path.exists():
-            click.echo(f"Warning: File not found: {file_path}", err=True)
-            continue
-        
-        ext = file_path.suffix.lower()
+    if ext in IMAGE_FORMATS:
+        limit = MAX_IMAGE_BYTES
+        if resize_images:
+            size = min(size, limit)
+    elif ext in DOCUMENT_FORMATS:
+        limit = MAX_DOCUMENT_BYTES
+    else:
+        limit = None
+    
+    if limit is not None and size > limit:
+        return 0, f"Warning: Skipping {file_path}: {size} bytes exceeds the {limit} byte limit"
+    
+    # Images and documents are sent as base64
+    encoded_size = (size + 2) // 3 * 4 if limit is not None else size
+    if payload_bytes + encoded_size > MAX_TOTAL_ATTACHMENT_BYTES:
+        return 0, (
+            f"Warning: Skipping {file_path}: request would exceed "
+            f"{MAX_TOTAL_ATTACHMENT_BYTES} bytes of attachments"
+        )
+    
+    return encoded_size, None
+
+
+def process_file(file_path_str: str, resize_images: bool = False) -> tuple[Optional[dict], str]:
+    """
+    Process a single input file into a content block for the API.
+    
+    Args:
+        file_path_str: Path of the file to process
+        resize_images: Downscale large images before sending
         
-        if ext in IMAGE_FORMATS:
-            # Process as image
-            base64_data, media_type = encode_file(file_path)
-            content_blocks.append({
-                "type": "image",
-                "source": {
-                    "type": "base64",
-                    "media_type": media_type,
-                    "data": base64_data
-                }
-            })
-            click.echo(f"Added image: {file_path.name}", err=True)
-            
-        elif ext in DOCUMENT_FORMATS:
-            # Process as PDF document (only PDF supported by Bedrock)
-            base64_data, media_type = encode_file(file_path)
-            content_blocks.append({
-                "type": "document",
-                "source": {
-                    "type": "base64",
-                    "media_type": "application/pdf",
-                    "data": base64_data
-                }
-            })
-            click.echo(f"Added PDF document: {file_path.name}", err=True)
-            
-        elif ext in TEXT_EXTRACTION_FORMATS:
-            # Extract text from document formats
+    Returns:
+        tuple: (content_block or None if the file was skipped, status message)
+    """
+    file_path = Path(file_path_str)
+    
+    if not file_path.exists():
+        return None, f"Warning: File not found: {file_path}"
+    
+    ext = file_path.suffix.lower()
+    
+    if ext in IMAGE_FORMATS:
+        # Process as image
+        if resize_images:
             try:
-                if ext in {'.docx'}:
-                    text_content = extract_text_from_docx(file_path)
-                    content_blocks.append({
-                        "type": "text",
-                        "text": f"[Content from {file_path.name}]\n\n{text_content}"
-                    })
-                    click.echo(f"Added text from DOCX: {file_path.name}", err=True)
-                else:
-                    # Try to read as plain text
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        text_content = f.read()
-                    content_blocks.append({
-                        "type": "text",
-                        "text": f"[Content from {file_path.name}]\n\n{text_content}"
-                    })
-                    click.echo(f"Added text file: {file_path.name}", err=True)
+                resized_data = resize_image(file_path)
+            except ImportError:
+                raise
             except Exception as e:
-                click.echo(f"Warning: Could not process file {file_path}: {e}", err=True)
-        else:
-            # Try to read as text
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    text_content = f.read()
-                content_blocks.append({
+                # Unreadable images, and ones Pillow refuses to decode as
+                # decompression bombs, are skipped like any other bad file
+                return None, f"Warning: Could not process file {file_path}: {e}"
+            
+            if resized_data is not None:
+                if len(resized_data) > MAX_IMAGE_BYTES:
+                    return None, (
+                        f"Warning: Skipping {file_path}: {len(resized_data)} bytes after "
+                        f"resizing exceeds the {MAX_IMAGE_BYTES} byte limit"
+                    )
+                return {
+                    "type": "image",
+                    "source": {
+                        "type": "base64",
+                        "media_type": "image/jpeg",
+                        "data": binascii.b2a_base64(resized_data, newline=False).decode('ascii')
+                    }
+                }, f"Added resized image: {file_path.name}"
+        
+        return {
+            "type": "image",
+            "source": {
+                "type": "base64",
+                "media_type": get_media_type(file_path),
+                "data": FileRef(file_path)
+            }
+        }, f"Added image: {file_path.name}"
+        
+    elif ext in DOCUMENT_FORMATS:
+        # Process as PDF document (only PDF supported by Bedrock)
+        return {
+            "type": "document",
+            "source": {
+                "type": "base64",
+                "media_type": get_media_type(file_path),
+                "data": FileRef(file_path)
+            }
+        }, f"Added PDF document: {file_path.name}"
+        
+    elif ext in TEXT_EXTRACTION_FORMATS:
+        # Extract text from document formats
+        try:
+            if ext in {'.docx'}:
+                text_content = extract_text_from_docx(file_path)
+                return {
                     "type": "text",
                     "text": f"[Content from {file_path.name}]\n\n{text_content}"
-                })
-                click.echo(f"Added text file: {file_path.name}", err=True)
-            except Exception as e:
-                click.echo(f"Warning: Could not process file {file_path}: {e}", err=True)
+                }, f"Added text from DOCX: {file_path.name}"
+            else:
+                # Try to read as plain text
+                check_utf8(file_path)
+                return {
+                    "type": "text",
+                    "text": TextFileRef(file_path, f"[Content from {file_path.name}]\n\n")
+                }, f"Added text file: {file_path.name}"
+        except Exception as e:
+            return None, f"Warning: Could not process file {file_path}: {e}"
+    else:
+        # Try to read as text
+        try:
+            check_utf8(file_path)
+            return {
+                "type": "text",
+                "text": TextFileRef(file_path, f"[Content from {file_path.name}]\n\n")
+            }, f"Added text file: {file_path.name}"
+        except Exception as e:
+            return None, f"Warning: Could not process file {file_path}: {e}"
+
+
+def process_files(file_paths: List[str], resize_images: bool = False) -> List[dict]:
+    """
+    Process input files and create content blocks for the API.
+    
+    Files are read concurrently; content blocks and status messages keep
+    the input order. A file given more than once is only checked and
+    extracted once; its content block is repeated, and write_request_body
+    encodes it only once.
+    
+    Args:
+        file_paths: List of file paths to process
+        resize_images: Downscale large images before sending
+        
+    Returns:
+        List of content blocks for the API request
+    """
+    if not file_paths:
+        return []
+    
+    # Check sizes up front so oversized files are never read
+    results = [None] * len(file_paths)
+    accepted = []
+    payload_bytes = 0
+    # Index of the first occurrence of each file, keyed by identity
+    seen = {}
+    duplicates = {}
+    for i, file_path_str in enumerate(file_paths):
+        file_path = Path(file_path_str)
+        # Missing files are reported by process_file
+        if file_path.exists():
+            file_bytes, warning = check_file_size(file_path, payload_bytes, resize_images)
+            if warning:
+                results[i] = (None, warning)
+                continue
+            payload_bytes += file_bytes
+            
+            st = file_path.stat()
+            key = (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+            if key in seen:
+                duplicates[i] = seen[key]
+                continue
+            seen[key] = i
+        accepted.append(i)
+    
+    if accepted:
+        with ThreadPoolExecutor(max_workers=min(8, len(accepted))) as executor:
+            processed = executor.map(
+                lambda file_path_str: process_file(file_path_str, resize_images),
+                [file_paths[i] for i in accepted]
+            )
+            for i, result in zip(accepted, processed):
+                results[i] = result
+    
+    for i, first in duplicates.items():
+        results[i] = results[first]
+    
+    content_blocks = []
+    messages = []
+    for block, message in results:
+        messages.append(message)
+        if block is not None:
+            content_blocks.append(block)
+    
+    # Report progress in a single write
+    click.echo('\n'.join(messages), err=True)
     
     return content_blocks
 
 
-def call_bedrock_claude(
+def get_client(service_name: str, region: str, profile: Optional[str] = None):
+    """
+    Get an AWS client for a service, region and profile.
+    
+    Clients are created once and reused, so credential resolution and the
+    HTTPS connection pool are shared across calls. botocore is imported
+    here rather than at module load to keep CLI startup fast, and used
+    directly since boto3's resource layer is not needed.
+    """
+    key = (service_name, profile, region)
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        import botocore.session
+        from botocore.config import Config
+        
+        session = botocore.session.Session(profile=profile)
+        client = _CLIENT_CACHE.setdefault(
+            key,
+            session.create_client(service_name, region_name=region, config=Config(**CLIENT_CONFIG))
+        )
+    return client
+
+
+def build_request_body(
     prompt: str,
-    files: List[str],
-    region: str,
+    file_blocks: List[dict],
     max_tokens: int,
-    temperature: float,
-    profile: Optional[str] = None
+    temperature: float
 ) -> dict:
     """
-    Call Claude Opus 4.5 on Amazon Bedrock.
+    Build the Anthropic messages request body.
     
     Args:
         prompt: The text prompt
-        files: List of file paths to include
-        region: AWS region
+        file_blocks: Content blocks from process_files
         max_tokens: Maximum tokens in response
         temperature: Temperature for generation
-        profile: AWS profile name (optional)
         
     Returns:
-        API response dictionary
+        Request body dictionary
     """
-    # Initialize boto3 client
-    session_kwargs = {}
-    if profile:
-        session_kwargs['profile_name'] = profile
-    
-    session = boto3.Session(**session_kwargs)
-    bedrock_runtime = session.client('bedrock-runtime', region_name=region)
-    
-    # Build content blocks
-    content_blocks = []
-    
-    # Add files first
-    if files:
-        file_blocks = process_files(files)
-        content_blocks.extend(file_blocks)
-    
-    # Add text prompt
+    # Files first, then the text prompt
+    content_blocks = list(file_blocks)
     content_blocks.append({
         "type": "text",
         "text": prompt
     })
     
-    # Prepare the request body
-    request_body = {
+    return {
         "anthropic_version": "bedrock-2023-05-31",
         "max_tokens": max_tokens,
         "temperature": temperature,
@@ -209,84 +603,547 @@ def call_bedrock_claude(
             }
         ]
     }
-    
-    # Make the API call
-    click.echo("Calling Claude Opus 4.5 on Bedrock...", err=True)
+
+
+def invoke_claude(bedrock_runtime, request_body: dict) -> dict:
+    """Send a request body to the model and return the parsed response."""
+    # File data is base64-encoded straight into the body buffer
+    body_buffer = io.BytesIO()
+    write_request_body(request_body, body_buffer)
     
     response = bedrock_runtime.invoke_model(
         modelId=MODEL_ID,
-        body=json.dumps(request_body)
+        body=body_buffer.getvalue()
     )
     
     # Parse response
-    response_body = json.loads(response['body'].read())
+    return loads_json(response['body'].read())
+
+
+def stream_claude(bedrock_runtime, request_body: dict, usage: dict) -> Iterator[str]:
+    """
+    Send a request body to the model and return its response text stream.
+    
+    The request is made before this returns, so request errors are raised
+    here rather than when the stream is first read. Token usage from the
+    stream events is added to usage.
+    """
+    # File data is base64-encoded straight into the body buffer
+    body_buffer = io.BytesIO()
+    write_request_body(request_body, body_buffer)
+    
+    response = bedrock_runtime.invoke_model_with_response_stream(
+        modelId=MODEL_ID,
+        body=body_buffer.getvalue()
+    )
+    
+    return stream_text_chunks(response['body'], usage)
+
+
+def stream_text_chunks(events: Iterable[dict], usage: dict) -> Iterator[str]:
+    """
+    Yield response text from stream events as it arrives.
+    
+    Text blocks are separated by a newline. Token usage from the events is
+    added to usage.
+    """
+    text_blocks = 0
+    for event in events:
+        chunk = event.get('chunk')
+        if chunk is None:
+            continue
+        
+        payload = loads_json(chunk['bytes'])
+        event_type = payload.get('type')
+        
+        if event_type == 'content_block_start':
+            if payload.get('content_block', {}).get('type') == 'text':
+                if text_blocks:
+                    yield '\n'
+                text_blocks += 1
+        elif event_type == 'content_block_delta':
+            text = payload.get('delta', {}).get('text')
+            if text:
+                yield text
+        elif event_type == 'message_start':
+            usage.update(payload.get('message', {}).get('usage', {}))
+        elif event_type == 'message_delta':
+            usage.update(payload.get('usage', {}))
+
+
+def call_bedrock_claude(
+    prompt: str,
+    files: List[str],
+    region: str,
+    max_tokens: int,
+    temperature: float,
+    profile: Optional[str] = None,
+    resize_images: bool = False
+) -> dict:
+    """
+    Call Claude Opus 4.5 on Amazon Bedrock.
+    
+    Args:
+        prompt: The text prompt
+        files: List of file paths to include
+        region: AWS region
+        max_tokens: Maximum tokens in response
+        temperature: Temperature for generation
+        profile: AWS profile name (optional)
+        resize_images: Downscale large images before sending
+        
+    Returns:
+        API response dictionary
+    """
+    bedrock_runtime = get_client('bedrock-runtime', region, profile)
+    file_blocks = process_files(files, resize_images) if files else []
+    request_body = build_request_body(prompt, file_blocks, max_tokens, temperature)
     
-    return response_body
+    # Make the API call
+    click.echo("Calling Claude Opus 4.5 on Bedrock...", err=True)
+    
+    return invoke_claude(bedrock_runtime, request_body)
 
 
-def extract_and_save_output(response: dict, output_dir: Path) -> str:
+def stream_bedrock_claude(
+    prompt: str,
+    files: List[str],
+    region: str,
+    max_tokens: int,
+    temperature: float,
+    profile: Optional[str] = None,
+    usage: Optional[dict] = None,
+    resize_images: bool = False
+) -> Iterator[str]:
     """
-    Extract content from response and save files if needed.
+    Call Claude Opus 4.5 on Amazon Bedrock and stream the response.
     
     Args:
-        response: API response
-        output_dir: Directory to save output files
+        prompt: The text prompt
+        files: List of file paths to include
+        region: AWS region
+        max_tokens: Maximum tokens in response
+        temperature: Temperature for generation
+        profile: AWS profile name (optional)
+        usage: Dictionary that receives token usage (optional)
+        resize_images: Downscale large images before sending
         
     Returns:
-        Text content to display
+        Iterator over response text chunks as they arrive
     """
-    content_blocks = response.get('content', [])
-    text_output = []
-    file_count = 0
+    bedrock_runtime = get_client('bedrock-runtime', region, profile)
+    file_blocks = process_files(files, resize_images) if files else []
+    request_body = build_request_body(prompt, file_blocks, max_tokens, temperature)
+    
+    # Make the API call
+    click.echo("Calling Claude Opus 4.5 on Bedrock...", err=True)
     
-    for block in content_blocks:
+    return stream_claude(bedrock_runtime, request_body, usage if usage is not None else {})
+
+
+def call_bedrock_claude_parallel(
+    prompts: List[str],
+    files: List[str],
+    region: str,
+    max_tokens: int,
+    temperature: float,
+    profile: Optional[str] = None,
+    max_parallel_requests: int = 8,
+    resize_images: bool = False
+) -> List[dict]:
+    """
+    Call Claude Opus 4.5 on Amazon Bedrock once per prompt, concurrently.
+    
+    The files are processed once and attached to every prompt. The client
+    is shared across worker threads.
+    
+    Args:
+        prompts: The text prompts
+        files: List of file paths to include with each prompt
+        region: AWS region
+        max_tokens: Maximum tokens in response
+        temperature: Temperature for generation
+        profile: AWS profile name (optional)
+        max_parallel_requests: Maximum number of requests in flight
+        resize_images: Downscale large images before sending
+        
+    Returns:
+        API response dictionaries, in prompt order. Failed requests have an
+        "error" key instead of content.
+    """
+    bedrock_runtime = get_client('bedrock-runtime', region, profile)
+    file_blocks = process_files(files, resize_images) if files else []
+    request_bodies = [
+        build_request_body(prompt, file_blocks, max_tokens, temperature)
+        for prompt in prompts
+    ]
+    
+    click.echo(
+        f"Calling Claude Opus 4.5 on Bedrock with {len(prompts)} prompts "
+        f"({max_parallel_requests} in parallel)...",
+        err=True
+    )
+    
+    with ThreadPoolExecutor(max_workers=max_parallel_requests) as executor:
+        futures = [
+            executor.submit(invoke_claude, bedrock_runtime, request_body)
+            for request_body in request_bodies
+        ]
+    
+    # A failed prompt is reported like a failed batch record, so the other
+    # responses are still displayed and saved
+    responses = []
+    for future in futures:
+        try:
+            responses.append(future.result())
+        except Exception as e:
+            responses.append({"error": str(e)})
+    
+    return responses
+
+
+def parse_s3_uri(s3_uri: str) -> tuple[str, str]:
+    """
+    Split an s3://bucket/prefix URI into its bucket and key prefix.
+    
+    Returns:
+        tuple: (bucket, prefix without trailing slash)
+    """
+    if not s3_uri.startswith('s3://'):
+        raise ValueError(f"Not an S3 URI: {s3_uri}")
+    bucket, _, prefix = s3_uri[len('s3://'):].partition('/')
+    return bucket, prefix.rstrip('/')
+
+
+def write_batch_input(request_bodies: List[dict], out: BinaryIO) -> None:
+    """
+    Write request bodies as batch inference JSONL records.
+    
+    Each record is {"recordId": "REQ0000001", "modelInput": <request body>}.
+    Files shared by the records are encoded once and copied for the rest.
+    """
+    written_spans = {}
+    for i, request_body in enumerate(request_bodies, 1):
+        write_request_body(
+            {"recordId": f"REQ{i:07d}", "modelInput": request_body},
+            out,
+            written_spans
+        )
+        out.write(b'\n')
+
+
+def call_bedrock_claude_batch(
+    prompts: List[str],
+    files: List[str],
+    region: str,
+    max_tokens: int,
+    temperature: float,
+    s3_uri: str,
+    role_arn: str,
+    profile: Optional[str] = None,
+    resize_images: bool = False
+) -> List[dict]:
+    """
+    Run prompts through a Bedrock batch inference job.
+    
+    The request bodies are uploaded as JSONL under s3_uri, the job is
+    polled until it finishes, and the output records are matched back to
+    their prompts.
+    
+    Args:
+        prompts: The text prompts
+        files: List of file paths to include with each prompt
+        region: AWS region
+        max_tokens: Maximum tokens in response
+        temperature: Temperature for generation
+        s3_uri: S3 location for the job input and output (s3://bucket/prefix)
+        role_arn: IAM service role that Bedrock assumes to run the job
+        profile: AWS profile name (optional)
+        resize_images: Downscale large images before sending
+        
+    Returns:
+        API response dictionaries, in prompt order. Failed records have an
+        "error" key instead of content.
+    """
+    s3 = get_client('s3', region, profile)
+    bedrock = get_client('bedrock', region, profile)
+    
+    bucket, prefix = parse_s3_uri(s3_uri)
+    job_name = f"bedrock-claude-{int(time.time())}"
+    input_name = f"{job_name}.jsonl"
+    input_key = f"{prefix}/input/{input_name}".lstrip('/')
+    output_prefix = f"{prefix}/output".lstrip('/')
+    
+    file_blocks = process_files(files, resize_images) if files else []
+    request_bodies = [
+        build_request_body(prompt, file_blocks, max_tokens, temperature)
+        for prompt in prompts
+    ]
+    
+    # Upload the job input
+    with tempfile.TemporaryFile() as input_file:
+        write_batch_input(request_bodies, input_file)
+        input_file.seek(0)
+        s3.put_object(Bucket=bucket, Key=input_key, Body=input_file)
+    click.echo(f"Uploaded {len(prompts)} records to: s3://{bucket}/{input_key}", err=True)
+    
+    job_arn = bedrock.create_model_invocation_job(
+        jobName=job_name,
+        modelId=MODEL_ID,
+        roleArn=role_arn,
+        inputDataConfig={
+            's3InputDataConfig': {
+                's3Uri': f"s3://{bucket}/{input_key}",
+                's3InputFormat': 'JSONL'
+            }
+        },
+        outputDataConfig={
+            's3OutputDataConfig': {
+                's3Uri': f"s3://{bucket}/{output_prefix}/"
+            }
+        }
+    )['jobArn']
+    click.echo(f"Started batch inference job: {job_arn}", err=True)
+    
+    # Wait for the job to finish
+    while True:
+        job = bedrock.get_model_invocation_job(jobIdentifier=job_arn)
+        status = job['status']
+        if status not in BATCH_PENDING_STATES:
+            break
+        click.echo(f"Batch job status: {status}", err=True)
+        time.sleep(BATCH_POLL_INTERVAL)
+    
+    if status not in {'Completed', 'PartiallyCompleted'}:
+        raise RuntimeError(f"Batch inference job {status}: {job.get('message', 'no details')}")
+    
+    # Output is written to <output prefix>/<job id>/<input file name>.out
+    job_id = job_arn.split('/')[-1]
+    output_key = f"{output_prefix}/{job_id}/{input_name}.out"
+    output_body = s3.get_object(Bucket=bucket, Key=output_key)['Body']
+    
+    records = {}
+    for line in output_body.iter_lines():
+        if line.strip():
+            record = loads_json(line)
+            records[record['recordId']] = record
+    
+    responses = []
+    for i in range(1, len(prompts) + 1):
+        record = records.get(f"REQ{i:07d}", {})
+        if 'modelOutput' in record:
+            responses.append(record['modelOutput'])
+        else:
+            responses.append({"error": record.get('error', "No output record")})
+    
+    return responses
+
+
+def load_prompts(prompt_path: Path) -> List[str]:
+    """
+    Load prompts from a prompt file.
+    
+    A .jsonl file holds one prompt per line, either as a JSON string or as
+    an object with a "prompt" key. Any other file is a single prompt.
+    
+    Args:
+        prompt_path: Path of the prompt file
+        
+    Returns:
+        List of non-empty prompts
+    """
+    with open(prompt_path, 'r', encoding='utf-8') as f:
+        if prompt_path.suffix.lower() != '.jsonl':
+            prompts = [f.read()]
+        else:
+            prompts = []
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                prompts.append(record['prompt'] if isinstance(record, dict) else record)
+    
+    return [prompt for prompt in prompts if prompt.strip()]
+
+
+def iter_code_blocks(text) -> Iterator[str]:
+    """
+    Yield the stripped fenced code blocks in UTF-8 encoded text.
+    
+    Finds the same blocks as r'```[\w]*\n(.*?)```' on the decoded text,
+    without decoding anything but the matches.
+    
+    Args:
+        text: UTF-8 bytes, or a buffer such as an mmap over them
+    """
+    pos = 0
+    while (match := CODE_BLOCK_RE.search(text, pos)) is not None:
+        # A bytes \w is ASCII-only, so check the tag as Unicode
+        if not CODE_TAG_RE.fullmatch(match.group(1).decode('utf-8')):
+            pos = match.start() + 1
+            continue
+        yield match.group(2).decode('utf-8').strip()
+        pos = match.end()
+
+
+def response_text_chunks(response: dict) -> Iterator[str]:
+    """Yield the text blocks of a response, separated by newlines."""
+    first = True
+    for block in response.get('content', []):
         if block.get('type') == 'text':
-            text_output.append(block.get('text', ''))
+            if not first:
+                yield '\n'
+            first = False
+            yield block.get('text', '')
         # Handle any other content types if needed
+
+
+def echo_chunks(text_chunks: Iterable[str]) -> Iterator[str]:
+    """Print text chunks to stdout as they pass through, then a newline."""
+    for text in text_chunks:
+        click.echo(text, nl=False)
+        yield text
+    click.echo()
+
+
+def extract_and_save_output(text_chunks: Iterable[str], output_dir: Optional[Path]) -> None:
+    """
+    Save response text to files if it looks like generated content.
     
-    combined_text = '\n'.join(text_output)
+    Chunks are held in memory until the text shows it will be saved (a code
+    fence, a JSON or XML prefix, or more than LONG_OUTPUT_LENGTH characters).
+    From then on they are written to a temporary file in output_dir, so a
+    long response is never held in memory as a whole, and short replies
+    never touch the disk. Once the response is complete the temporary file
+    is renamed to the output file, split into code blocks, or discarded.
     
-    # Check if output looks like it should be saved as a file
-    # Look for common file indicators in the text
-    should_save = any([
-        '```' in combined_text,  # Code blocks
-        len(combined_text) > 5000,  # Long output
-        combined_text.strip().startswith('<?xml'),  # XML
-        combined_text.strip().startswith('{') or combined_text.strip().startswith('['),  # JSON
-    ])
+    Args:
+        text_chunks: Response text, in chunks
+        output_dir: Directory to save output files (None to save nothing)
+    """
+    if not output_dir:
+        for _ in text_chunks:
+            pass
+        return
     
-    if should_save and output_dir:
-        output_dir.mkdir(parents=True, exist_ok=True)
+    # Look for common file indicators in the text as it streams past: the
+    # leading non-whitespace characters, the length, and a code fence that
+    # may be split across chunks
+    prefix = ''
+    length = 0
+    has_code = False
+    tail = ''
+    
+    buffered = []
+    f = None
+    partial_file = None
+    created_dirs = []
+    file_count = 0
+    
+    try:
+        for text in text_chunks:
+            length += len(text)
+            if len(prefix) < 5:
+                prefix = (prefix + text).lstrip()[:5]
+            if not has_code:
+                window = tail + text
+                has_code = '```' in window
+                tail = window[-2:]
+            
+            if f is None:
+                buffered.append(text)
+                if not (has_code or length > LONG_OUTPUT_LENGTH
+                        or prefix.startswith(('{', '[', '<?xml'))):
+                    continue
+                
+                # The text will be saved, so spill it to disk. Note the
+                # directories this creates, deepest first, so they can be
+                # removed again if nothing ends up saved
+                created_dirs = [d for d in (output_dir, *output_dir.parents) if not d.exists()]
+                output_dir.mkdir(parents=True, exist_ok=True)
+                fd, name = tempfile.mkstemp(prefix='.output.', suffix='.partial', dir=output_dir)
+                partial_file = Path(name)
+                f = open(fd, 'wb', buffering=WRITE_BUFFER_SIZE)
+                if hasattr(os, 'posix_fadvise'):
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                text = ''.join(buffered)
+                buffered = None
+            f.write(text.encode('utf-8'))
         
-        # Try to determine file type from content
-        text_stripped = combined_text.strip()
+        if f is None:
+            # Short reply with nothing worth saving
+            return
+        f.close()
+        # mkstemp creates the file readable by its owner only; give the
+        # saved output the usual permissions
+        umask = os.umask(0)
+        os.umask(umask)
+        partial_file.chmod(0o666 & ~umask)
+        
+        is_json = prefix.startswith(('{', '['))  # JSON
+        is_xml = prefix.startswith('<?xml')  # XML
+        is_long = length > LONG_OUTPUT_LENGTH  # Long output
         
-        if '```' in combined_text:
-            # Extract code blocks
-            import re
-            code_blocks = re.findall(r'```[\w]*\n(.*?)```', combined_text, re.DOTALL)
-            for i, code in enumerate(code_blocks):
-                file_count += 1
-                output_file = output_dir / f"output_{file_count}.txt"
-                output_file.write_text(code.strip())
-                click.echo(f"Saved code block to: {output_file}", err=True)
-        elif text_stripped.startswith('{') or text_stripped.startswith('['):
+        # Try to determine file type from content
+        if has_code:
+            # Extract code blocks straight from the mapped file
+            with open(partial_file, 'rb') as partial, \
+                    mmap.mmap(partial.fileno(), 0, access=mmap.ACCESS_READ) as text:
+                for code in iter_code_blocks(text):
+                    file_count += 1
+                    output_file = output_dir / f"output_{file_count}.txt"
+                    output_file.write_bytes(code.encode('utf-8'))
+                    click.echo(f"Saved code block to: {output_file}", err=True)
+        elif is_json:
             output_file = output_dir / "output.json"
-            output_file.write_text(combined_text)
+            partial_file.replace(output_file)
             click.echo(f"Saved JSON output to: {output_file}", err=True)
             file_count += 1
-        elif text_stripped.startswith('<?xml'):
+        elif is_xml:
             output_file = output_dir / "output.xml"
-            output_file.write_text(combined_text)
+            partial_file.replace(output_file)
             click.echo(f"Saved XML output to: {output_file}", err=True)
             file_count += 1
-        else:
+        elif is_long:
             output_file = output_dir / "output.txt"
-            output_file.write_text(combined_text)
+            partial_file.replace(output_file)
             click.echo(f"Saved output to: {output_file}", err=True)
             file_count += 1
+    finally:
+        if f is not None:
+            f.close()
+        if partial_file is not None:
+            partial_file.unlink(missing_ok=True)
+            if not file_count:
+                for created_dir in created_dirs:
+                    created_dir.rmdir()
+
+
+def display_header(title: str) -> None:
+    """Print the banner shown above a response."""
+    click.echo("\n" + "="*80)
+    click.echo(f"{title}:")
+    click.echo("="*80 + "\n")
+
+
+def display_usage(usage: dict) -> None:
+    """Print token usage for a response."""
+    if usage:
+        click.echo("\n" + "="*80, err=True)
+        click.echo(f"Input tokens: {usage.get('input_tokens', 0)}", err=True)
+        click.echo(f"Output tokens: {usage.get('output_tokens', 0)}", err=True)
+        click.echo("="*80, err=True)
+
+
+def display_response(response: dict, output_path: Optional[Path], title: str) -> None:
+    """Save, print, and report usage for a single model response."""
+    if 'error' in response:
+        click.echo(f"Warning: Request failed: {response['error']}", err=True)
     
-    return combined_text
+    # Display and save the output
+    display_header(title)
+    extract_and_save_output(echo_chunks(response_text_chunks(response)), output_path)
+    display_usage(response.get('usage', {}))
 
 
 @click.command()
@@ -294,7 +1151,7 @@ def extract_and_save_output(response: dict, output_dir: Path) -> str:
     '--prompt-file', '-p',
     type=click.Path(exists=True),
     required=True,
-    help='File containing the prompt text'
+    help='File containing the prompt text, or a .jsonl file with one prompt per line'
 )
 @click.option(
     '--file', '-f',
@@ -335,53 +1192,116 @@ def extract_and_save_output(response: dict, output_dir: Path) -> str:
     default=True,
     help='Save output to file if it looks like generated content (default: True)'
 )
-def cli(prompt_file, files, output_dir, region, profile, max_tokens, temperature, save_output):
+@click.option(
+    '--max-parallel-requests',
+    default=8,
+    type=click.IntRange(min=1),
+    help='Maximum concurrent requests when the prompt file holds several prompts (default: 8)'
+)
+@click.option(
+    '--batch',
+    is_flag=True,
+    default=False,
+    help='Run the prompts as a Bedrock batch inference job (requires --s3-uri and --role-arn)'
+)
+@click.option(
+    '--s3-uri',
+    default=None,
+    help='S3 location for batch job input and output, e.g. s3://bucket/prefix'
+)
+@click.option(
+    '--role-arn',
+    default=None,
+    help='IAM service role ARN that Bedrock assumes to run the batch job'
+)
+@click.option(
+    '--resize-images/--no-resize-images',
+    default=False,
+    help='Downscale images larger than 1568px and re-encode them as JPEG before sending (default: False)'
+)
+def cli(prompt_file, files, output_dir, region, profile, max_tokens, temperature, save_output,
+        max_parallel_requests, batch, s3_uri, role_arn, resize_images):
     """
     Call Claude Opus 4.5 on Amazon Bedrock with files and prompt.
     
     Example usage:
     
         bedrock-claude -p prompt.txt -f image1.png -f document.pdf -o ./outputs
+    
+        bedrock-claude -p prompts.jsonl -f data.csv --max-parallel-requests 4
+    
+        bedrock-claude -p prompts.jsonl --batch --s3-uri s3://bucket/jobs --role-arn <arn>
     """
+    if batch and not (s3_uri and role_arn):
+        raise click.UsageError("--batch requires --s3-uri and --role-arn")
+    
     try:
-        # Read prompt from file
+        # Read prompts from file
         prompt_path = Path(prompt_file)
-        with open(prompt_path, 'r', encoding='utf-8') as f:
-            prompt = f.read()
+        prompts = load_prompts(prompt_path)
         
-        if not prompt.strip():
+        if not prompts:
             click.echo("Error: Prompt file is empty", err=True)
             sys.exit(1)
         
-        click.echo(f"Loaded prompt from: {prompt_path}", err=True)
-        
-        # Call the API
-        response = call_bedrock_claude(
-            prompt=prompt,
-            files=list(files),
-            region=region,
-            max_tokens=max_tokens,
-            temperature=temperature,
-            profile=profile
-        )
-        
-        # Extract and display/save output
+        click.echo(f"Loaded {len(prompts)} prompt(s) from: {prompt_path}", err=True)
         output_path = Path(output_dir) if save_output else None
-        text_output = extract_and_save_output(response, output_path)
-        
-        # Display the output
-        click.echo("\n" + "="*80)
-        click.echo("CLAUDE'S RESPONSE:")
-        click.echo("="*80 + "\n")
-        click.echo(text_output)
         
-        # Display usage information
-        usage = response.get('usage', {})
-        if usage:
-            click.echo("\n" + "="*80, err=True)
-            click.echo(f"Input tokens: {usage.get('input_tokens', 0)}", err=True)
-            click.echo(f"Output tokens: {usage.get('output_tokens', 0)}", err=True)
-            click.echo("="*80, err=True)
+        if len(prompts) == 1 and not batch:
+            # Call the API; the response is displayed and saved as it streams in
+            usage = {}
+            text_stream = stream_bedrock_claude(
+                prompt=prompts[0],
+                files=list(files),
+                region=region,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                profile=profile,
+                usage=usage,
+                resize_images=resize_images
+            )
+            display_header("CLAUDE'S RESPONSE")
+            extract_and_save_output(echo_chunks(text_stream), output_path)
+            display_usage(usage)
+        else:
+            # Call the API once per prompt
+            if batch:
+                # Run all prompts as a single batch inference job
+                responses = call_bedrock_claude_batch(
+                    prompts=prompts,
+                    files=list(files),
+                    region=region,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    s3_uri=s3_uri,
+                    role_arn=role_arn,
+                    profile=profile,
+                    resize_images=resize_images
+                )
+            else:
+                responses = call_bedrock_claude_parallel(
+                    prompts=prompts,
+                    files=list(files),
+                    region=region,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    profile=profile,
+                    max_parallel_requests=max_parallel_requests,
+                    resize_images=resize_images
+                )
+            for i, response in enumerate(responses, 1):
+                # Keep each prompt's saved files apart
+                prompt_output_path = output_path / f"prompt_{i}" if output_path else None
+                display_response(
+                    response,
+                    prompt_output_path,
+                    f"CLAUDE'S RESPONSE ({i}/{len(responses)})"
+                )
+            
+            failed = sum(1 for response in responses if 'error' in response)
+            if failed:
+                click.echo(f"Error: {failed} of {len(responses)} prompt(s) failed", err=True)
+                sys.exit(1)
         
     except Exception as e:
         click.echo(f"Error: {e}", err=True)